@@ -21,6 +21,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Maximum points drawn per trend line; longer series are down-sampled
+MAX_TREND_POINTS = 2000
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -67,6 +70,20 @@ def format_number(num):
     else:
         return str(int(num))
 
+def format_numbers(values):
+    """Vectorized format_number for a column of counts"""
+    v = np.asarray(values, dtype=float)
+    return np.select(
+        [v >= 1000000, v >= 1000],
+        [np.char.mod('%.1fM', v / 1000000), np.char.mod('%.1fK', v / 1000)],
+        default=v.astype(np.int64).astype(str)
+    )
+
+def format_percentages(values):
+    """Format a column of percentages to one decimal, with N/A for missing values"""
+    v = np.asarray(values, dtype=float)
+    return np.where(np.isnan(v), "N/A", np.char.mod('%.1f%%', v))
+
 def format_growth(growth):
     """Format growth percentage with colors"""
     if pd.isna(growth):
@@ -76,6 +93,69 @@ def format_growth(growth):
     else:
         return f'<span class="growth-negative">{growth:.1f}%</span>'
 
+@st.cache_data(show_spinner=False)
+def load_performance_table(_db, start_date, end_date, vehicle_category):
+    """Load and cache the formatted manufacturer summary table"""
+    manufacturer_summary = _db.get_dashboard_bundle(start_date, end_date)['manufacturer_summary']
+    if vehicle_category and not manufacturer_summary.empty:
+        manufacturer_summary = manufacturer_summary[
+            manufacturer_summary['vehicle_category'] == vehicle_category].reset_index(drop=True)
+    
+    if manufacturer_summary.empty:
+        return manufacturer_summary
+    
+    # Format the data for display
+    display_df = manufacturer_summary.copy()
+    display_df['total_registrations'] = format_numbers(display_df['total_registrations'])
+    display_df['avg_yoy_growth'] = format_percentages(display_df['avg_yoy_growth'])
+    display_df['avg_qoq_growth'] = format_percentages(display_df['avg_qoq_growth'])
+    
+    display_df.columns = ['Manufacturer', 'Category', 'Total Registrations', 'Avg YoY Growth', 'Avg QoQ Growth']
+    return display_df
+
+def lttb_indices(x, y, n_out):
+    """Pick n_out point indices with Largest-Triangle-Three-Buckets, keeping the line shape"""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    bucket_size = (n - 2) / (n_out - 2)
+    a = 0
+    
+    for i in range(n_out - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        
+        # Average of the next bucket is the third triangle vertex
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) -
+                      (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        indices[i + 1] = a
+    
+    return indices
+
+def downsample_trends(df, x, y, group, n_out=MAX_TREND_POINTS):
+    """Down-sample each series in df to at most n_out points before plotting"""
+    if df.empty or df.groupby(group).size().max() <= n_out:
+        return df
+    
+    parts = []
+    for _, series in df.groupby(group, sort=False):
+        series = series.sort_values(x)
+        keep = lttb_indices(
+            series[x].to_numpy(dtype='datetime64[ns]').astype(np.int64).astype(np.float64),
+            series[y].to_numpy(dtype=np.float64),
+            n_out
+        )
+        parts.append(series.iloc[keep])
+    return pd.concat(parts, ignore_index=True)
+
 def main():
     st.title("🚗 Vehicle Registration Dashboard")
     st.markdown("**An Investor-Focused Analysis of Indian Automotive Market**")
@@ -121,13 +201,7 @@ def main():
     )
     
     # Manufacturer filter
-    if selected_categories:
-        manufacturers = []
-        for cat in selected_categories:
-            manufacturers.extend(db.get_manufacturers(cat))
-        manufacturers = list(set(manufacturers))
-    else:
-        manufacturers = db.get_manufacturers()
+    manufacturers = db.get_manufacturers_for(selected_categories)
     
     selected_manufacturers = st.sidebar.multiselect(
         "Manufacturers",
@@ -145,8 +219,9 @@ def main():
     
     col1, col2, col3, col4 = st.columns(4)
     
-    # Get summary data
-    category_summary = db.get_category_summary(start_date, end_date)
+    # Get summary data; every summary view comes from one cached aggregate query
+    bundle = db.get_dashboard_bundle(start_date, end_date)
+    category_summary = bundle['category_summary']
     
     if not category_summary.empty:
         total_registrations = category_summary['total_registrations'].sum()
@@ -188,17 +263,24 @@ def main():
     with col1:
         st.subheader("📊 Registration Trends by Category")
         
-        # Get monthly trends
-        trends_data = db.get_monthly_trends(
-            start_date, end_date, 
-            selected_categories, 
-            selected_manufacturers if selected_manufacturers else None
-        )
+        # Get monthly trends; the category rollup only applies without a
+        # manufacturer filter
+        if selected_manufacturers:
+            trends_data = db.get_monthly_trends(
+                start_date, end_date, 
+                selected_categories, 
+                selected_manufacturers
+            )
+            category_trends = trends_data
+            if not trends_data.empty:
+                # Aggregate by category and date
+                category_trends = trends_data.groupby(['date', 'vehicle_category'])['registrations'].sum().reset_index()
+        else:
+            category_trends = db.get_category_month_trends(start_date, end_date, selected_categories)
         
-        if not trends_data.empty:
-            # Aggregate by category and date
-            category_trends = trends_data.groupby(['date', 'vehicle_category'])['registrations'].sum().reset_index()
+        if not category_trends.empty:
             category_trends['date'] = pd.to_datetime(category_trends['date'])
+            category_trends = downsample_trends(category_trends, 'date', 'registrations', 'vehicle_category')
             
             fig = px.line(
                 category_trends, 
@@ -209,7 +291,7 @@ def main():
                 labels={'registrations': 'Registrations', 'date': 'Date'}
             )
             fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, key="trend_by_category")
         else:
             st.info("No data available for selected filters.")
     
@@ -224,7 +306,7 @@ def main():
                 title="Registration Share by Vehicle Category"
             )
             fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, key="category_share_pie")
     
     # Growth Analysis
     st.header("📈 Growth Analysis")
@@ -234,7 +316,7 @@ def main():
     with col1:
         st.subheader("🏆 Top YoY Growth Performers")
         
-        growth_leaders_yoy = db.get_growth_leaders(start_date, end_date, 'yoy')
+        growth_leaders_yoy = bundle['growth_yoy']
         
         if not growth_leaders_yoy.empty:
             fig = px.bar(
@@ -247,14 +329,14 @@ def main():
                 labels={'avg_growth': 'Average YoY Growth (%)', 'manufacturer': 'Manufacturer'}
             )
             fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, key="yoy_growth_leaders")
         else:
             st.info("No growth data available.")
     
     with col2:
         st.subheader("⚡ Top QoQ Growth Performers")
         
-        growth_leaders_qoq = db.get_growth_leaders(start_date, end_date, 'qoq')
+        growth_leaders_qoq = bundle['growth_qoq']
         
         if not growth_leaders_qoq.empty:
             fig = px.bar(
@@ -267,7 +349,7 @@ def main():
                 labels={'avg_growth': 'Average QoQ Growth (%)', 'manufacturer': 'Manufacturer'}
             )
             fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, key="qoq_growth_leaders")
         else:
             st.info("No growth data available.")
     
@@ -281,7 +363,9 @@ def main():
     )
     
     if selected_category_for_share:
-        market_share_data = db.get_market_share_data(start_date, end_date, selected_category_for_share)
+        market_share_data = bundle['market_share']
+        if not market_share_data.empty:
+            market_share_data = market_share_data[market_share_data['vehicle_category'] == selected_category_for_share]
         
         if not market_share_data.empty:
             col1, col2 = st.columns(2)
@@ -293,7 +377,7 @@ def main():
                     names='manufacturer',
                     title=f"Market Share - {selected_category_for_share} Category"
                 )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True, key="manufacturer_share_pie")
             
             with col2:
                 fig = px.bar(
@@ -304,25 +388,17 @@ def main():
                     labels={'market_share': 'Market Share (%)', 'manufacturer': 'Manufacturer'}
                 )
                 fig.update_layout(xaxis_tickangle=45)
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True, key="manufacturer_share_bar")
     
     # Detailed Data Table
     st.header("📋 Detailed Performance Summary")
     
-    manufacturer_summary = db.get_manufacturer_summary(
-        start_date, end_date,
+    display_df = load_performance_table(
+        db, start_date, end_date,
         selected_category_for_share if 'selected_category_for_share' in locals() else None
     )
     
-    if not manufacturer_summary.empty:
-        # Format the data for display
-        display_df = manufacturer_summary.copy()
-        display_df['total_registrations'] = display_df['total_registrations'].apply(format_number)
-        display_df['avg_yoy_growth'] = display_df['avg_yoy_growth'].apply(lambda x: f"{x:.1f}%" if not pd.isna(x) else "N/A")
-        display_df['avg_qoq_growth'] = display_df['avg_qoq_growth'].apply(lambda x: f"{x:.1f}%" if not pd.isna(x) else "N/A")
-        
-        display_df.columns = ['Manufacturer', 'Category', 'Total Registrations', 'Avg YoY Growth', 'Avg QoQ Growth']
-        
+    if not display_df.empty:
         st.dataframe(display_df, use_container_width=True, height=400)
     
     # Investment Insights
@@ -3,11 +3,528 @@ Database utilities for vehicle registration dashboard
 Handles SQL operations and data retrieval
 """
 
+import json
+import logging
 import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
 import pandas as pd
-from typing import Dict, List, Tuple, Optional
+import streamlit as st
+from typing import Dict, Iterator, List, Tuple, Optional
 from datetime import datetime, timedelta
 
+# Query results are cached per (db_path, filters) so dashboard reruns with
+# unchanged filters skip SQLite and DataFrame materialization entirely.
+CACHE_TTL = 3600
+
+# Outside `streamlit run` (e.g. the insights CLI) st.cache_data falls back to
+# an in-memory cache and logs a warning for every decorated function
+if not st.runtime.exists():
+    logging.getLogger('streamlit.runtime.caching.cache_data_api').setLevel(logging.ERROR)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_conn(db_path: str) -> sqlite3.Connection:
+    """Open one shared read-only connection per database file"""
+    uri = Path(db_path).resolve().as_uri() + '?mode=ro'
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    conn.execute('PRAGMA query_only=1')
+    conn.execute('PRAGMA mmap_size=268435456')
+    conn.execute('PRAGMA cache_size=-65536')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    return conn
+
+
+def _read_sql(db_path: str, query: str, params: tuple = ()) -> pd.DataFrame:
+    """Execute SQL query against db_path and return DataFrame"""
+    # Build the frame straight from the cursor rows; read_sql_query wraps the
+    # same fetch in pandas' SQL abstraction layer on every call. The shared
+    # connection keeps an LRU of prepared statements keyed on the SQL text,
+    # so the module-level _SQL_* constants below are parsed only once.
+    cursor = _get_conn(db_path).execute(query, params)
+    try:
+        columns = [col[0] for col in cursor.description]
+        frame = pd.DataFrame.from_records(cursor.fetchall(), columns=columns, coerce_float=True)
+    finally:
+        cursor.close()
+    
+    # Text columns (dates, categories, manufacturers) are stored Arrow-backed
+    # rather than as boxed Python str objects; pyarrow ships with Streamlit.
+    # All-NULL columns infer as 'empty' and keep their object dtype.
+    for column in frame.columns:
+        if frame[column].dtype == object and pd.api.types.infer_dtype(frame[column]) == 'string':
+            frame[column] = frame[column].astype('string[pyarrow]')
+    return frame
+
+
+# YoY/QoQ growth is derived on demand from the registrations series rather
+# than stored. The window runs over the full table so rows at the start of a
+# date range still see their prior-year/prior-quarter values.
+_GROWTH_CTE = """
+WITH growth AS (
+    SELECT 
+        date,
+        year,
+        month,
+        quarter,
+        vehicle_category,
+        manufacturer,
+        registrations,
+        ROUND((registrations - LAG(registrations, 12) OVER w) * 100.0 /
+              LAG(registrations, 12) OVER w, 2) as yoy_growth,
+        ROUND((registrations - LAG(registrations, 3) OVER w) * 100.0 /
+              LAG(registrations, 3) OVER w, 2) as qoq_growth
+    FROM vehicle_registrations
+    WINDOW w AS (PARTITION BY vehicle_category, manufacturer ORDER BY date)
+)
+"""
+
+
+# IN-list filters bind their values as one JSON array parameter, so the SQL
+# text (and the prepared statement the connection caches for it) is the same
+# however many categories or manufacturers are selected
+def _in_clause(column: str) -> str:
+    """Build an ` AND column IN (...)` filter bound to one _json_list parameter"""
+    return f" AND {column} IN (SELECT value FROM json_each(?))"
+
+
+def _json_list(values: tuple) -> str:
+    """Encode IN-list values as the JSON array parameter of _in_clause"""
+    return json.dumps(list(values))
+
+
+_SQL_DATE_RANGE = """
+SELECT MIN(date) as min_date, MAX(date) as max_date
+FROM vehicle_registrations
+"""
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
+def _run_date_range(db_path: str) -> pd.DataFrame:
+    """Cached MIN/MAX date lookup"""
+    return _read_sql(db_path, _SQL_DATE_RANGE)
+
+
+_SQL_VEHICLE_CATEGORIES = "SELECT DISTINCT vehicle_category FROM vehicle_registrations ORDER BY vehicle_category"
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
+def _run_vehicle_categories(db_path: str) -> pd.DataFrame:
+    """Cached distinct vehicle categories"""
+    return _read_sql(db_path, _SQL_VEHICLE_CATEGORIES)
+
+
+_SQL_MANUFACTURERS = "SELECT DISTINCT manufacturer FROM vehicle_registrations ORDER BY manufacturer"
+
+_SQL_CATEGORY_MANUFACTURERS = """
+SELECT DISTINCT manufacturer 
+FROM vehicle_registrations 
+WHERE vehicle_category = ?
+ORDER BY manufacturer
+"""
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
+def _run_manufacturers(db_path: str, vehicle_category: Optional[str]) -> pd.DataFrame:
+    """Cached distinct manufacturers"""
+    if vehicle_category:
+        return _read_sql(db_path, _SQL_CATEGORY_MANUFACTURERS, (vehicle_category,))
+    return _read_sql(db_path, _SQL_MANUFACTURERS)
+
+
+_SQL_MANUFACTURERS_FOR = """
+SELECT DISTINCT manufacturer 
+FROM vehicle_registrations 
+WHERE vehicle_category IN (SELECT value FROM json_each(?))
+ORDER BY manufacturer
+"""
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
+def _run_manufacturers_for(db_path: str, vehicle_categories: tuple) -> pd.DataFrame:
+    """Cached distinct manufacturers across several vehicle categories"""
+    return _read_sql(db_path, _SQL_MANUFACTURERS_FOR, (_json_list(vehicle_categories),))
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
+def _run_filtered_data(db_path: str,
+                       start: str,
+                       end: str,
+                       vehicle_categories: tuple,
+                       manufacturers: tuple,
+                       columns: tuple) -> pd.DataFrame:
+    """Cached filtered registration rows"""
+    query = f"""
+    SELECT {', '.join(columns)}
+    FROM vehicle_registrations
+    WHERE date BETWEEN ? AND ?
+    """
+    params = [start, end]
+    
+    if vehicle_categories:
+        query += _in_clause('vehicle_category')
+        params.append(_json_list(vehicle_categories))
+    
+    if manufacturers:
+        query += _in_clause('manufacturer')
+        params.append(_json_list(manufacturers))
+    
+    query += " ORDER BY date, vehicle_category, manufacturer"
+    
+    return _read_sql(db_path, query, tuple(params))
+
+
+def _sql_limit(limit: Optional[int]) -> int:
+    """Bind value for LIMIT ?; SQLite treats a negative limit as no limit"""
+    return -1 if limit is None else limit
+
+
+def _last_n_days(query: str) -> str:
+    """Rewrite a query's date range parameters as a window ending today (local time)"""
+    return query.replace("date BETWEEN ? AND ?",
+                         "date BETWEEN date('now', 'localtime', ?) AND date('now', 'localtime')")
+
+
+def _days_ago(days: int) -> str:
+    """SQLite date modifier for the start of a trailing window"""
+    return f'-{int(days)} days'
+
+
+_SQL_CATEGORY_SUMMARY = _GROWTH_CTE + """
+SELECT 
+    vehicle_category,
+    SUM(registrations) as total_registrations,
+    AVG(yoy_growth) as avg_yoy_growth,
+    AVG(qoq_growth) as avg_qoq_growth,
+    COUNT(DISTINCT manufacturer) as num_manufacturers,
+    SUM(registrations) * 100.0 / SUM(SUM(registrations)) OVER () as market_share
+FROM growth
+WHERE date BETWEEN ? AND ?
+GROUP BY vehicle_category
+ORDER BY total_registrations DESC
+"""
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
+def _run_category_summary(db_path: str, start: str, end: str) -> pd.DataFrame:
+    """Cached summary by vehicle category"""
+    return _read_sql(db_path, _SQL_CATEGORY_SUMMARY, (start, end))
+
+
+# Totals and shares only: no growth columns, so the LAG window is skipped
+# and the monthly rollup is read instead of the per-manufacturer rows
+_SQL_CATEGORY_SHARE_LAST_N_DAYS = _last_n_days("""
+SELECT 
+    vehicle_category,
+    SUM(registrations) as total_registrations,
+    SUM(registrations) * 100.0 / SUM(SUM(registrations)) OVER () as market_share
+FROM vehicle_registrations_monthly
+WHERE date BETWEEN ? AND ?
+GROUP BY vehicle_category
+ORDER BY total_registrations DESC
+""")
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
+def _run_category_share_last_n_days(db_path: str, days: int) -> pd.DataFrame:
+    """Cached registration totals and market share by vehicle category over the trailing window"""
+    return _read_sql(db_path, _SQL_CATEGORY_SHARE_LAST_N_DAYS, (_days_ago(days),))
+
+
+_SQL_MANUFACTURER_SUMMARY_TEMPLATE = _GROWTH_CTE + """
+SELECT 
+    manufacturer,
+    vehicle_category,
+    SUM(registrations) as total_registrations,
+    AVG(yoy_growth) as avg_yoy_growth,
+    AVG(qoq_growth) as avg_qoq_growth
+FROM growth
+WHERE date BETWEEN ? AND ?{category_filter}
+GROUP BY manufacturer, vehicle_category
+ORDER BY total_registrations DESC
+"""
+_SQL_MANUFACTURER_SUMMARY = _SQL_MANUFACTURER_SUMMARY_TEMPLATE.format(category_filter="")
+_SQL_CATEGORY_MANUFACTURER_SUMMARY = _SQL_MANUFACTURER_SUMMARY_TEMPLATE.format(
+    category_filter=" AND vehicle_category = ?")
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
+def _run_manufacturer_summary(db_path: str,
+                              start: str,
+                              end: str,
+                              vehicle_category: Optional[str]) -> pd.DataFrame:
+    """Cached summary by manufacturer"""
+    if vehicle_category:
+        return _read_sql(db_path, _SQL_CATEGORY_MANUFACTURER_SUMMARY, (start, end, vehicle_category))
+    return _read_sql(db_path, _SQL_MANUFACTURER_SUMMARY, (start, end))
+
+
+_SQL_MONTHLY_TRENDS = _GROWTH_CTE + """
+SELECT 
+    date,
+    year,
+    month,
+    quarter,
+    vehicle_category,
+    manufacturer,
+    SUM(registrations) as registrations,
+    AVG(yoy_growth) as yoy_growth,
+    AVG(qoq_growth) as qoq_growth
+FROM growth
+WHERE date BETWEEN ? AND ?
+"""
+
+_SQL_MONTHLY_TRENDS_GROUPING = """
+GROUP BY date, year, month, quarter, vehicle_category, manufacturer
+ORDER BY date, vehicle_category, manufacturer
+"""
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
+def _run_monthly_trends(db_path: str,
+                        start: str,
+                        end: str,
+                        vehicle_categories: tuple,
+                        manufacturers: tuple) -> pd.DataFrame:
+    """Cached monthly trend data"""
+    query = _SQL_MONTHLY_TRENDS
+    params = [start, end]
+    
+    if vehicle_categories:
+        query += _in_clause('vehicle_category')
+        params.append(_json_list(vehicle_categories))
+    
+    if manufacturers:
+        query += _in_clause('manufacturer')
+        params.append(_json_list(manufacturers))
+    
+    query += _SQL_MONTHLY_TRENDS_GROUPING
+    
+    return _read_sql(db_path, query, tuple(params))
+
+
+_SQL_CATEGORY_MONTH_TRENDS = """
+SELECT date, vehicle_category, registrations
+FROM vehicle_registrations_monthly
+WHERE date BETWEEN ? AND ?
+"""
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
+def _run_category_month_trends(db_path: str,
+                               start: str,
+                               end: str,
+                               vehicle_categories: tuple) -> pd.DataFrame:
+    """Cached category x month totals from the monthly rollup table"""
+    query = _SQL_CATEGORY_MONTH_TRENDS
+    params = [start, end]
+    
+    if vehicle_categories:
+        query += _in_clause('vehicle_category')
+        params.append(_json_list(vehicle_categories))
+    
+    query += " ORDER BY date, vehicle_category"
+    
+    return _read_sql(db_path, query, tuple(params))
+
+
+_SQL_GROWTH_LEADERS_TEMPLATE = _GROWTH_CTE + """
+SELECT 
+    manufacturer,
+    vehicle_category,
+    AVG({growth_column}) as avg_growth,
+    SUM(registrations) as total_registrations
+FROM growth
+WHERE date BETWEEN ? AND ?
+AND {growth_column} IS NOT NULL
+GROUP BY manufacturer, vehicle_category
+HAVING total_registrations > 1000
+ORDER BY avg_growth DESC
+LIMIT ?
+"""
+_SQL_GROWTH_LEADERS = {
+    'yoy': _SQL_GROWTH_LEADERS_TEMPLATE.format(growth_column='yoy_growth'),
+    'qoq': _SQL_GROWTH_LEADERS_TEMPLATE.format(growth_column='qoq_growth')
+}
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
+def _run_growth_leaders(db_path: str,
+                        start: str,
+                        end: str,
+                        growth_type: str,
+                        limit: int) -> pd.DataFrame:
+    """Cached top growth performers"""
+    query = _SQL_GROWTH_LEADERS['yoy' if growth_type == 'yoy' else 'qoq']
+    return _read_sql(db_path, query, (start, end, limit))
+
+
+_SQL_GROWTH_LEADERS_LAST_N_DAYS = {
+    growth_type: _last_n_days(query) for growth_type, query in _SQL_GROWTH_LEADERS.items()
+}
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
+def _run_growth_leaders_last_n_days(db_path: str,
+                                    days: int,
+                                    growth_type: str,
+                                    limit: int) -> pd.DataFrame:
+    """Cached top growth performers over the trailing window"""
+    query = _SQL_GROWTH_LEADERS_LAST_N_DAYS['yoy' if growth_type == 'yoy' else 'qoq']
+    return _read_sql(db_path, query, (_days_ago(days), limit))
+
+
+_SQL_MARKET_SHARE = """
+SELECT 
+    manufacturer,
+    SUM(registrations) as total_registrations,
+    ROUND(SUM(registrations) * 100.0 / SUM(SUM(registrations)) OVER (), 2) as market_share
+FROM vehicle_registrations
+WHERE date BETWEEN ? AND ?
+AND vehicle_category = ?
+GROUP BY manufacturer
+ORDER BY total_registrations DESC
+LIMIT ?
+"""
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
+def _run_market_share_data(db_path: str,
+                           start: str,
+                           end: str,
+                           vehicle_category: str,
+                           top_n: int) -> pd.DataFrame:
+    """Cached market share for a vehicle category"""
+    return _read_sql(db_path, _SQL_MARKET_SHARE, (start, end, vehicle_category, top_n))
+
+
+_SQL_MARKET_LEADERS = """
+WITH totals AS (
+    SELECT 
+        vehicle_category,
+        manufacturer,
+        SUM(registrations) as total_registrations
+    FROM vehicle_registrations
+    WHERE date BETWEEN ? AND ?
+    GROUP BY vehicle_category, manufacturer
+),
+ranked AS (
+    SELECT 
+        vehicle_category,
+        manufacturer,
+        ROUND(total_registrations * 100.0 /
+              SUM(total_registrations) OVER (PARTITION BY vehicle_category), 2) as market_share,
+        ROW_NUMBER() OVER (PARTITION BY vehicle_category
+                           ORDER BY total_registrations DESC) as category_rank
+    FROM totals
+)
+SELECT vehicle_category, manufacturer, market_share
+FROM ranked
+WHERE category_rank = 1
+ORDER BY vehicle_category
+"""
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
+def _run_market_leaders(db_path: str, start: str, end: str) -> pd.DataFrame:
+    """Cached top manufacturer by market share in each vehicle category"""
+    return _read_sql(db_path, _SQL_MARKET_LEADERS, (start, end))
+
+
+_SQL_MARKET_LEADERS_LAST_N_DAYS = _last_n_days(_SQL_MARKET_LEADERS)
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
+def _run_market_leaders_last_n_days(db_path: str, days: int) -> pd.DataFrame:
+    """Cached market share leaders over the trailing window"""
+    return _read_sql(db_path, _SQL_MARKET_LEADERS_LAST_N_DAYS, (_days_ago(days),))
+
+
+# Columns returned by get_filtered_data unless the caller asks for others
+FILTERED_DATA_COLUMNS = ('date', 'vehicle_category', 'manufacturer', 'registrations')
+
+# Views sliced out of the dashboard bundle
+DASHBOARD_VIEWS = ('category_summary', 'manufacturer_summary', 'market_share', 'growth_yoy', 'growth_qoq')
+
+
+def _growth_leaders_from(base: pd.DataFrame, growth_type: str) -> pd.DataFrame:
+    """Top 10 growth performers rolled up from per-manufacturer aggregates"""
+    leaders = base[base[f'{growth_type}_count'] > 0]
+    leaders = pd.DataFrame({
+        'manufacturer': leaders['manufacturer'],
+        'vehicle_category': leaders['vehicle_category'],
+        'avg_growth': leaders[f'{growth_type}_sum'] / leaders[f'{growth_type}_count'],
+        'total_registrations': leaders[f'{growth_type}_registrations']
+    })
+    leaders = leaders[leaders['total_registrations'] > 1000]
+    return leaders.sort_values('avg_growth', ascending=False).head(10).reset_index(drop=True)
+
+
+_SQL_DASHBOARD_BUNDLE = _GROWTH_CTE + """
+SELECT 
+    vehicle_category,
+    manufacturer,
+    SUM(registrations) as total_registrations,
+    SUM(yoy_growth) as yoy_sum,
+    COUNT(yoy_growth) as yoy_count,
+    SUM(CASE WHEN yoy_growth IS NOT NULL THEN registrations END) as yoy_registrations,
+    SUM(qoq_growth) as qoq_sum,
+    COUNT(qoq_growth) as qoq_count,
+    SUM(CASE WHEN qoq_growth IS NOT NULL THEN registrations END) as qoq_registrations
+FROM growth
+WHERE date BETWEEN ? AND ?
+GROUP BY vehicle_category, manufacturer
+"""
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
+def _run_dashboard_bundle(db_path: str, start: str, end: str) -> Dict[str, pd.DataFrame]:
+    """Cached dashboard summary views built from one aggregate query"""
+    base = _read_sql(db_path, _SQL_DASHBOARD_BUNDLE, (start, end))
+    growth_columns = ['yoy_sum', 'yoy_count', 'yoy_registrations', 'qoq_sum', 'qoq_count', 'qoq_registrations']
+    base = base.astype({'total_registrations': 'int64', **{column: float for column in growth_columns}})
+    
+    # SQLite has no GROUPING SETS, so the coarser views are rolled up from the
+    # (category, manufacturer) rows; averages are rebuilt from sums and counts
+    # so they match AVG() over the underlying monthly rows
+    manufacturer_summary = pd.DataFrame({
+        'manufacturer': base['manufacturer'],
+        'vehicle_category': base['vehicle_category'],
+        'total_registrations': base['total_registrations'],
+        'avg_yoy_growth': base['yoy_sum'] / base['yoy_count'],
+        'avg_qoq_growth': base['qoq_sum'] / base['qoq_count']
+    }).sort_values('total_registrations', ascending=False).reset_index(drop=True)
+    
+    by_category = base.groupby('vehicle_category', as_index=False).agg(
+        total_registrations=('total_registrations', 'sum'),
+        yoy_sum=('yoy_sum', 'sum'),
+        yoy_count=('yoy_count', 'sum'),
+        qoq_sum=('qoq_sum', 'sum'),
+        qoq_count=('qoq_count', 'sum'),
+        num_manufacturers=('manufacturer', 'nunique')
+    )
+    category_summary = pd.DataFrame({
+        'vehicle_category': by_category['vehicle_category'],
+        'total_registrations': by_category['total_registrations'],
+        'avg_yoy_growth': by_category['yoy_sum'] / by_category['yoy_count'],
+        'avg_qoq_growth': by_category['qoq_sum'] / by_category['qoq_count'],
+        'num_manufacturers': by_category['num_manufacturers']
+    }).sort_values('total_registrations', ascending=False).reset_index(drop=True)
+    
+    category_totals = manufacturer_summary.groupby('vehicle_category')['total_registrations'].transform('sum')
+    market_share = manufacturer_summary[['vehicle_category', 'manufacturer', 'total_registrations']].assign(
+        market_share=(manufacturer_summary['total_registrations'] * 100.0 / category_totals).round(2)
+    )
+    
+    return {
+        'category_summary': category_summary,
+        'manufacturer_summary': manufacturer_summary,
+        'market_share': market_share,
+        'growth_yoy': _growth_leaders_from(base, 'yoy'),
+        'growth_qoq': _growth_leaders_from(base, 'qoq')
+    }
+
+
 class DatabaseManager:
     """
     Manages database operations for vehicle registration data
@@ -23,122 +540,99 @@ class DatabaseManager:
     def execute_query(self, query: str, params: tuple = ()) -> pd.DataFrame:
         """Execute SQL query and return DataFrame"""
         try:
-            conn = self.get_connection()
-            df = pd.read_sql_query(query, conn, params=params)
-            conn.close()
-            return df
+            return _read_sql(self.db_path, query, params)
+        except Exception as e:
+            print(f"Error executing query: {e}")
+            return pd.DataFrame()
+    
+    @contextmanager
+    def raw_cursor(self) -> Iterator[sqlite3.Cursor]:
+        """Yield a cursor on the shared read-only connection, bypassing pandas"""
+        cursor = _get_conn(self.db_path).cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+    
+    def fetch_one(self, query: str, params: tuple = ()) -> Optional[tuple]:
+        """Execute SQL query and return its first row as a plain tuple"""
+        # Single-row aggregates skip DataFrame construction entirely
+        try:
+            with self.raw_cursor() as cursor:
+                return cursor.execute(query, params).fetchone()
+        except Exception as e:
+            print(f"Error executing query: {e}")
+            return None
+    
+    def _cached_query(self, runner, *args) -> pd.DataFrame:
+        """Run a cached query function, returning an empty DataFrame on error"""
+        try:
+            return runner(self.db_path, *args)
         except Exception as e:
             print(f"Error executing query: {e}")
             return pd.DataFrame()
     
     def get_date_range(self) -> Tuple[datetime, datetime]:
         """Get the available date range in the database"""
-        query = """
-        SELECT MIN(date) as min_date, MAX(date) as max_date
-        FROM vehicle_registrations
-        """
-        result = self.execute_query(query)
+        result = self._cached_query(_run_date_range)
         if not result.empty:
-            min_date = pd.to_datetime(result.iloc[0]['min_date'])
-            max_date = pd.to_datetime(result.iloc[0]['max_date'])
+            min_date = pd.to_datetime(result.iat[0, 0])
+            max_date = pd.to_datetime(result.iat[0, 1])
             return min_date, max_date
         return datetime.now() - timedelta(days=365), datetime.now()
     
     def get_vehicle_categories(self) -> List[str]:
         """Get all unique vehicle categories"""
-        query = "SELECT DISTINCT vehicle_category FROM vehicle_registrations ORDER BY vehicle_category"
-        result = self.execute_query(query)
+        result = self._cached_query(_run_vehicle_categories)
         return result['vehicle_category'].tolist() if not result.empty else []
     
     def get_manufacturers(self, vehicle_category: Optional[str] = None) -> List[str]:
         """Get manufacturers, optionally filtered by vehicle category"""
-        if vehicle_category:
-            query = """
-            SELECT DISTINCT manufacturer 
-            FROM vehicle_registrations 
-            WHERE vehicle_category = ?
-            ORDER BY manufacturer
-            """
-            result = self.execute_query(query, (vehicle_category,))
-        else:
-            query = "SELECT DISTINCT manufacturer FROM vehicle_registrations ORDER BY manufacturer"
-            result = self.execute_query(query)
+        result = self._cached_query(_run_manufacturers, vehicle_category)
+        return result['manufacturer'].tolist() if not result.empty else []
+    
+    def get_manufacturers_for(self, vehicle_categories: List[str]) -> List[str]:
+        """Get manufacturers active in any of the given vehicle categories"""
+        if not vehicle_categories:
+            return self.get_manufacturers()
+        result = self._cached_query(_run_manufacturers_for, tuple(vehicle_categories))
         return result['manufacturer'].tolist() if not result.empty else []
     
     def get_filtered_data(self, 
                          start_date: datetime,
                          end_date: datetime,
                          vehicle_categories: List[str] = None,
-                         manufacturers: List[str] = None) -> pd.DataFrame:
-        """Get filtered vehicle registration data"""
-        
-        query = """
-        SELECT *
-        FROM vehicle_registrations
-        WHERE date BETWEEN ? AND ?
-        """
-        params = [start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')]
-        
-        if vehicle_categories:
-            placeholders = ','.join(['?' for _ in vehicle_categories])
-            query += f" AND vehicle_category IN ({placeholders})"
-            params.extend(vehicle_categories)
-        
-        if manufacturers:
-            placeholders = ','.join(['?' for _ in manufacturers])
-            query += f" AND manufacturer IN ({placeholders})"
-            params.extend(manufacturers)
-        
-        query += " ORDER BY date, vehicle_category, manufacturer"
-        
-        return self.execute_query(query, tuple(params))
+                         manufacturers: List[str] = None,
+                         columns: Tuple[str, ...] = FILTERED_DATA_COLUMNS) -> pd.DataFrame:
+        """Get filtered vehicle registration data, projected to the given columns"""
+        return self._cached_query(_run_filtered_data,
+                                  start_date.strftime('%Y-%m-%d'),
+                                  end_date.strftime('%Y-%m-%d'),
+                                  tuple(vehicle_categories or ()),
+                                  tuple(manufacturers or ()),
+                                  tuple(columns))
     
     def get_category_summary(self, 
                            start_date: datetime,
                            end_date: datetime) -> pd.DataFrame:
         """Get summary by vehicle category"""
-        query = """
-        SELECT 
-            vehicle_category,
-            SUM(registrations) as total_registrations,
-            AVG(yoy_growth) as avg_yoy_growth,
-            AVG(qoq_growth) as avg_qoq_growth,
-            COUNT(DISTINCT manufacturer) as num_manufacturers
-        FROM vehicle_registrations
-        WHERE date BETWEEN ? AND ?
-        GROUP BY vehicle_category
-        ORDER BY total_registrations DESC
-        """
-        return self.execute_query(query, (start_date.strftime('%Y-%m-%d'), 
-                                        end_date.strftime('%Y-%m-%d')))
+        return self._cached_query(_run_category_summary,
+                                  start_date.strftime('%Y-%m-%d'),
+                                  end_date.strftime('%Y-%m-%d'))
+    
+    def get_category_share_last_n_days(self, days: int = 730) -> pd.DataFrame:
+        """Get registration totals and market share by vehicle category for the last `days` days"""
+        return self._cached_query(_run_category_share_last_n_days, days)
     
     def get_manufacturer_summary(self, 
                                start_date: datetime,
                                end_date: datetime,
                                vehicle_category: Optional[str] = None) -> pd.DataFrame:
         """Get summary by manufacturer"""
-        query = """
-        SELECT 
-            manufacturer,
-            vehicle_category,
-            SUM(registrations) as total_registrations,
-            AVG(yoy_growth) as avg_yoy_growth,
-            AVG(qoq_growth) as avg_qoq_growth
-        FROM vehicle_registrations
-        WHERE date BETWEEN ? AND ?
-        """
-        params = [start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')]
-        
-        if vehicle_category:
-            query += " AND vehicle_category = ?"
-            params.append(vehicle_category)
-        
-        query += """
-        GROUP BY manufacturer, vehicle_category
-        ORDER BY total_registrations DESC
-        """
-        
-        return self.execute_query(query, tuple(params))
+        return self._cached_query(_run_manufacturer_summary,
+                                  start_date.strftime('%Y-%m-%d'),
+                                  end_date.strftime('%Y-%m-%d'),
+                                  vehicle_category)
     
     def get_monthly_trends(self, 
                           start_date: datetime,
@@ -146,90 +640,76 @@ class DatabaseManager:
                           vehicle_categories: List[str] = None,
                           manufacturers: List[str] = None) -> pd.DataFrame:
         """Get monthly trend data"""
-        
-        query = """
-        SELECT 
-            date,
-            year,
-            month,
-            quarter,
-            vehicle_category,
-            manufacturer,
-            SUM(registrations) as registrations,
-            AVG(yoy_growth) as yoy_growth,
-            AVG(qoq_growth) as qoq_growth
-        FROM vehicle_registrations
-        WHERE date BETWEEN ? AND ?
-        """
-        params = [start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')]
-        
-        if vehicle_categories:
-            placeholders = ','.join(['?' for _ in vehicle_categories])
-            query += f" AND vehicle_category IN ({placeholders})"
-            params.extend(vehicle_categories)
-        
-        if manufacturers:
-            placeholders = ','.join(['?' for _ in manufacturers])
-            query += f" AND manufacturer IN ({placeholders})"
-            params.extend(manufacturers)
-        
-        query += """
-        GROUP BY date, year, month, quarter, vehicle_category, manufacturer
-        ORDER BY date, vehicle_category, manufacturer
-        """
-        
-        return self.execute_query(query, tuple(params))
+        return self._cached_query(_run_monthly_trends,
+                                  start_date.strftime('%Y-%m-%d'),
+                                  end_date.strftime('%Y-%m-%d'),
+                                  tuple(vehicle_categories or ()),
+                                  tuple(manufacturers or ()))
+    
+    def get_category_month_trends(self,
+                                  start_date: datetime,
+                                  end_date: datetime,
+                                  vehicle_categories: List[str] = None) -> pd.DataFrame:
+        """Get monthly registration totals per vehicle category"""
+        return self._cached_query(_run_category_month_trends,
+                                  start_date.strftime('%Y-%m-%d'),
+                                  end_date.strftime('%Y-%m-%d'),
+                                  tuple(vehicle_categories or ()))
     
     def get_growth_leaders(self, 
                           start_date: datetime,
                           end_date: datetime,
-                          growth_type: str = 'yoy') -> pd.DataFrame:
-        """Get top growth performers"""
-        
-        growth_column = 'yoy_growth' if growth_type == 'yoy' else 'qoq_growth'
-        
-        query = f"""
-        SELECT 
-            manufacturer,
-            vehicle_category,
-            AVG({growth_column}) as avg_growth,
-            SUM(registrations) as total_registrations
-        FROM vehicle_registrations
-        WHERE date BETWEEN ? AND ?
-        AND {growth_column} IS NOT NULL
-        GROUP BY manufacturer, vehicle_category
-        HAVING total_registrations > 1000
-        ORDER BY avg_growth DESC
-        LIMIT 10
-        """
-        
-        return self.execute_query(query, (start_date.strftime('%Y-%m-%d'), 
-                                        end_date.strftime('%Y-%m-%d')))
+                          growth_type: str = 'yoy',
+                          limit: Optional[int] = 10) -> pd.DataFrame:
+        """Get the top `limit` growth performers (all of them if limit is None)"""
+        return self._cached_query(_run_growth_leaders,
+                                  start_date.strftime('%Y-%m-%d'),
+                                  end_date.strftime('%Y-%m-%d'),
+                                  growth_type,
+                                  _sql_limit(limit))
+    
+    def get_growth_leaders_last_n_days(self,
+                                       days: int = 730,
+                                       growth_type: str = 'yoy',
+                                       limit: Optional[int] = 10) -> pd.DataFrame:
+        """Get the top `limit` growth performers for the last `days` days"""
+        return self._cached_query(_run_growth_leaders_last_n_days,
+                                  days,
+                                  growth_type,
+                                  _sql_limit(limit))
     
     def get_market_share_data(self, 
                              start_date: datetime,
                              end_date: datetime,
-                             vehicle_category: str) -> pd.DataFrame:
-        """Get market share data for a specific vehicle category"""
-        
-        query = """
-        SELECT 
-            manufacturer,
-            SUM(registrations) as total_registrations,
-            ROUND(SUM(registrations) * 100.0 / 
-                  (SELECT SUM(registrations) 
-                   FROM vehicle_registrations 
-                   WHERE date BETWEEN ? AND ? 
-                   AND vehicle_category = ?), 2) as market_share
-        FROM vehicle_registrations
-        WHERE date BETWEEN ? AND ?
-        AND vehicle_category = ?
-        GROUP BY manufacturer
-        ORDER BY total_registrations DESC
-        """
-        
-        params = (start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'), 
-                 vehicle_category, start_date.strftime('%Y-%m-%d'), 
-                 end_date.strftime('%Y-%m-%d'), vehicle_category)
-        
-        return self.execute_query(query, params)
+                             vehicle_category: str,
+                             top_n: Optional[int] = None) -> pd.DataFrame:
+        """Get market share data for a specific vehicle category, optionally only the top_n manufacturers"""
+        return self._cached_query(_run_market_share_data,
+                                  start_date.strftime('%Y-%m-%d'),
+                                  end_date.strftime('%Y-%m-%d'),
+                                  vehicle_category,
+                                  _sql_limit(top_n))
+    
+    def get_market_leaders(self,
+                           start_date: datetime,
+                           end_date: datetime) -> pd.DataFrame:
+        """Get the market share leader of every vehicle category"""
+        return self._cached_query(_run_market_leaders,
+                                  start_date.strftime('%Y-%m-%d'),
+                                  end_date.strftime('%Y-%m-%d'))
+    
+    def get_market_leaders_last_n_days(self, days: int = 730) -> pd.DataFrame:
+        """Get the market share leader of every vehicle category for the last `days` days"""
+        return self._cached_query(_run_market_leaders_last_n_days, days)
+    
+    def get_dashboard_bundle(self,
+                             start_date: datetime,
+                             end_date: datetime) -> Dict[str, pd.DataFrame]:
+        """Get every dashboard summary view (see DASHBOARD_VIEWS) from one query"""
+        try:
+            return _run_dashboard_bundle(self.db_path,
+                                         start_date.strftime('%Y-%m-%d'),
+                                         end_date.strftime('%Y-%m-%d'))
+        except Exception as e:
+            print(f"Error executing query: {e}")
+            return {view: pd.DataFrame() for view in DASHBOARD_VIEWS}
@@ -4,154 +4,161 @@ Vehicle Registration Data Insights Analysis
 This script generates key insights for investment analysis
 """
 
-import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
+import sys
+from datetime import date
 from database_utils import DatabaseManager
-import matplotlib.pyplot as plt
-import seaborn as sns
 
-def analyze_market_trends():
+# Static report copy
+INSIGHTS = (
+    "🎯 Two-wheeler segment dominates with 75%+ market share",
+    "📈 Electric vehicle manufacturers showing 20%+ growth rates", 
+    "🏭 Market consolidation trend - top 3 players control 60%+ share",
+    "📅 Strong seasonal patterns - 30% spike during festival months",
+    "🔄 Post-COVID recovery shows V-shaped bounce in registrations",
+    "🌟 Premium segment resilience during economic downturns",
+    "🚀 Rural market expansion driving volume growth",
+    "⚡ Technology adoption accelerating in commercial vehicles"
+)
+
+RECOMMENDATIONS = (
+    "BUY: Electric vehicle manufacturers with proven tech",
+    "HOLD: Established 2W leaders with strong distribution", 
+    "WATCH: New entrants in premium 4W segment",
+    "AVOID: Traditional ICE-only players without EV roadmap",
+    "OPPORTUNITY: Commercial vehicle electrification plays",
+    "RISK: Commodity price inflation impacting margins"
+)
+
+def analyze_market_trends(db: DatabaseManager):
     """Generate comprehensive market analysis"""
     
-    print("🚗 Vehicle Registration Market Analysis")
-    print("=" * 50)
+    # Report lines are collected and written to stdout in one call
+    out = []
     
-    db = DatabaseManager()
+    out.append("🚗 Vehicle Registration Market Analysis")
+    out.append("=" * 50)
     
-    # Date range for analysis (last 2 years)
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=730)
+    # Date range for analysis (last 2 years); queries apply the same
+    # trailing window in SQL
+    analysis_days = 730
+    end_date = date.today()
+    start_date = date.fromordinal(end_date.toordinal() - analysis_days)
     
-    print(f"Analysis Period: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
-    print()
+    out.append(f"Analysis Period: {start_date.isoformat()} to {end_date.isoformat()}")
+    out.append("")
     
     # 1. Market Size Analysis
-    print("📈 MARKET SIZE ANALYSIS")
-    print("-" * 30)
+    out.append("📈 MARKET SIZE ANALYSIS")
+    out.append("-" * 30)
     
-    category_summary = db.get_category_summary(start_date, end_date)
+    category_summary = db.get_category_share_last_n_days(analysis_days)
     if not category_summary.empty:
-        print("Total Registrations by Category:")
-        for _, row in category_summary.iterrows():
-            category = row['vehicle_category']
-            total = row['total_registrations']
-            share = (total / category_summary['total_registrations'].sum()) * 100
-            print(f"  {category}: {total:,} ({share:.1f}%)")
+        out.append("Total Registrations by Category:")
+        # Shares come precomputed from SQL; lines are built column-wise
+        totals = category_summary['total_registrations']
+        lines = ("  " + category_summary['vehicle_category'] +
+                 ": " + totals.map('{:,}'.format) +
+                 " (" + category_summary['market_share'].map('{:.1f}%'.format) + ")")
+        out.extend(lines)
         
-        total_market = category_summary['total_registrations'].sum()
-        print(f"\nTotal Market Size: {total_market:,} registrations")
+        total_market = totals.sum()
+        out.append(f"\nTotal Market Size: {total_market:,} registrations")
     
-    print()
+    out.append("")
     
     # 2. Growth Analysis
-    print("📊 GROWTH ANALYSIS")
-    print("-" * 20)
+    out.append("📊 GROWTH ANALYSIS")
+    out.append("-" * 20)
     
-    growth_yoy = db.get_growth_leaders(start_date, end_date, 'yoy')
+    growth_yoy = db.get_growth_leaders_last_n_days(analysis_days, 'yoy', limit=5)
     if not growth_yoy.empty:
-        print("Top YoY Growth Performers:")
-        for i, row in growth_yoy.head(5).iterrows():
-            manufacturer = row['manufacturer']
-            category = row['vehicle_category']
-            growth = row['avg_growth']
-            print(f"  {manufacturer} ({category}): {growth:.1f}% YoY")
+        out.append("Top YoY Growth Performers:")
+        top_growth = growth_yoy[['manufacturer', 'vehicle_category', 'avg_growth']]
+        for manufacturer, category, growth in top_growth.itertuples(index=False, name=None):
+            out.append(f"  {manufacturer} ({category}): {growth:.1f}% YoY")
     
-    print()
+    out.append("")
     
     # 3. Market Leadership
-    print("🏆 MARKET LEADERSHIP")
-    print("-" * 20)
+    out.append("🏆 MARKET LEADERSHIP")
+    out.append("-" * 20)
     
-    for category in ['2W', '3W', '4W']:
-        market_share = db.get_market_share_data(start_date, end_date, category)
-        if not market_share.empty:
-            leader = market_share.iloc[0]
-            print(f"{category} Market Leader: {leader['manufacturer']} ({leader['market_share']:.1f}%)")
+    leaders = db.get_market_leaders_last_n_days(analysis_days)
+    if not leaders.empty:
+        leaders = leaders.set_index('vehicle_category')
+        for category in ('2W', '3W', '4W'):
+            if category in leaders.index:
+                leader = leaders.loc[category]
+                out.append(f"{category} Market Leader: {leader['manufacturer']} ({leader['market_share']:.1f}%)")
     
-    print()
+    out.append("")
     
     # 4. Investment Insights
-    print("💡 KEY INVESTMENT INSIGHTS")
-    print("-" * 30)
-    
-    insights = [
-        "🎯 Two-wheeler segment dominates with 75%+ market share",
-        "📈 Electric vehicle manufacturers showing 20%+ growth rates", 
-        "🏭 Market consolidation trend - top 3 players control 60%+ share",
-        "📅 Strong seasonal patterns - 30% spike during festival months",
-        "🔄 Post-COVID recovery shows V-shaped bounce in registrations",
-        "🌟 Premium segment resilience during economic downturns",
-        "🚀 Rural market expansion driving volume growth",
-        "⚡ Technology adoption accelerating in commercial vehicles"
-    ]
+    out.append("💡 KEY INVESTMENT INSIGHTS")
+    out.append("-" * 30)
     
-    for insight in insights:
-        print(f"  {insight}")
+    for insight in INSIGHTS:
+        out.append(f"  {insight}")
     
-    print()
+    out.append("")
     
     # 5. Investment Recommendations  
-    print("🎯 INVESTMENT RECOMMENDATIONS")
-    print("-" * 35)
-    
-    recommendations = [
-        "BUY: Electric vehicle manufacturers with proven tech",
-        "HOLD: Established 2W leaders with strong distribution", 
-        "WATCH: New entrants in premium 4W segment",
-        "AVOID: Traditional ICE-only players without EV roadmap",
-        "OPPORTUNITY: Commercial vehicle electrification plays",
-        "RISK: Commodity price inflation impacting margins"
-    ]
+    out.append("🎯 INVESTMENT RECOMMENDATIONS")
+    out.append("-" * 35)
     
-    for rec in recommendations:
-        print(f"  • {rec}")
+    for rec in RECOMMENDATIONS:
+        out.append(f"  • {rec}")
     
-    print()
+    out.append("")
     
     # 6. Market Dynamics
-    print("🌊 MARKET DYNAMICS")
-    print("-" * 20)
-    
-    print("Positive Catalysts:")
-    print("  • Government EV incentives and policies")
-    print("  • Rising fuel costs driving EV adoption")  
-    print("  • Improving charging infrastructure")
-    print("  • Growing environmental consciousness")
-    
-    print("\nRisk Factors:")
-    print("  • Semiconductor shortages affecting production")
-    print("  • Rising raw material costs")
-    print("  • Regulatory changes and compliance costs")
-    print("  • Economic slowdown impacting discretionary spending")
-    
-    print()
-    print("=" * 50)
-    print("Analysis completed! 📊")
-    print("For detailed interactive analysis, run: streamlit run dashboard.py")
+    out.append("🌊 MARKET DYNAMICS")
+    out.append("-" * 20)
+    
+    out.append("Positive Catalysts:")
+    out.append("  • Government EV incentives and policies")
+    out.append("  • Rising fuel costs driving EV adoption")  
+    out.append("  • Improving charging infrastructure")
+    out.append("  • Growing environmental consciousness")
+    
+    out.append("\nRisk Factors:")
+    out.append("  • Semiconductor shortages affecting production")
+    out.append("  • Rising raw material costs")
+    out.append("  • Regulatory changes and compliance costs")
+    out.append("  • Economic slowdown impacting discretionary spending")
+    
+    out.append("")
+    out.append("=" * 50)
+    out.append("Analysis completed! 📊")
+    out.append("For detailed interactive analysis, run: streamlit run dashboard.py")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
-def generate_summary_stats():
+def generate_summary_stats(db: DatabaseManager):
     """Generate summary statistics for the dataset"""
     
-    db = DatabaseManager()
-    
-    # Get full dataset statistics
-    query = "SELECT COUNT(*) as total_records FROM vehicle_registrations"
-    total_records = db.execute_query(query).iloc[0]['total_records']
-    
-    query = "SELECT COUNT(DISTINCT manufacturer) as total_manufacturers FROM vehicle_registrations"
-    total_manufacturers = db.execute_query(query).iloc[0]['total_manufacturers']
-    
-    query = "SELECT MIN(date) as start_date, MAX(date) as end_date FROM vehicle_registrations"
-    date_range = db.execute_query(query)
+    # Get full dataset statistics in a single scan
+    query = """
+    SELECT 
+        COUNT(*) as total_records,
+        COUNT(DISTINCT manufacturer) as total_manufacturers,
+        MIN(date) as start_date,
+        MAX(date) as end_date
+    FROM vehicle_registrations
+    """
+    stats = db.fetch_one(query)
+    if stats is None:
+        return
+    total_records, total_manufacturers, start_date, end_date = stats
     
     print("\n📊 DATASET SUMMARY")
     print("-" * 20)
     print(f"Total Records: {total_records:,}")
     print(f"Manufacturers: {total_manufacturers}")
-    print(f"Date Range: {date_range.iloc[0]['start_date']} to {date_range.iloc[0]['end_date']}")
+    print(f"Date Range: {start_date} to {end_date}")
     print(f"Data Points: Monthly registration data with YoY/QoQ growth")
 
 if __name__ == "__main__":
-    analyze_market_trends()
-    generate_summary_stats()
+    db = DatabaseManager()
+    analyze_market_trends(db)
+    generate_summary_stats(db)
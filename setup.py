@@ -3,15 +3,42 @@
 Setup script for Vehicle Registration Dashboard
 """
 
+import re
 import subprocess
 import sys
 import os
 
+def requirements_satisfied(path="requirements.txt"):
+    """Check whether every requirement in the file is already installed"""
+    try:
+        from importlib import metadata
+    except ImportError:  # Python 3.7
+        return False
+    
+    with open(path) as f:
+        for line in f:
+            name = line.split("#", 1)[0].strip()
+            if not name:
+                continue
+            # Version specifiers, extras and URLs are left for pip to resolve
+            if not re.fullmatch(r"[A-Za-z0-9._-]+", name):
+                return False
+            try:
+                metadata.version(name)
+            except metadata.PackageNotFoundError:
+                return False
+    return True
+
 def install_requirements():
     """Install required packages from requirements.txt"""
+    if requirements_satisfied():
+        print("✅ All packages already installed")
+        return True
+    
     print("Installing required packages...")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "--prefer-binary",
+                               "-r", "requirements.txt"])
         print("✅ All packages installed successfully!")
     except subprocess.CalledProcessError as e:
         print(f"❌ Error installing packages: {e}")